@@ -20,7 +20,7 @@ echo "Running tests..."
 docker run --name $CONTAINER_NAME \
     --entrypoint python3 \
     --rm $IMAGE_NAME \
-    /app/test_example.py
+    -m pytest -q /app/test_example.py
 
 EXIT_CODE=$?
 
@@ -25,428 +25,639 @@ easy to calculate reimbursements and settle balances between friends.
 """
 
 import argparse
+import functools
 import sys
 import os
-import json
+
+# orjson is a Rust-based JSON serializer that is several times faster than the
+# stdlib for both dumps and loads. It is optional; fall back to stdlib json
+# when it is not installed.
+#
+# orjson produces UTF-8 bytes directly, so _emit writes them to the binary
+# stdout buffer rather than going through print(), which would decode to str
+# and re-encode the whole payload on the way out.
+try:
+    import orjson as _orjson
+
+    def _emit(obj):
+        sys.stdout.buffer.write(_orjson.dumps(obj))
+        sys.stdout.buffer.write(b"\n")
+
+    def _dump_bytes(obj):
+        return _orjson.dumps(obj)
+except ImportError:
+    import json as _json
+
+    def _emit(obj):
+        sys.stdout.write(_json.dumps(obj))
+        sys.stdout.write("\n")
+
+    def _dump_bytes(obj):
+        return _json.dumps(obj).encode()
+
 from models import DatabaseManager
 from services import GatheringService
 
-def setup_parser():
-    """Set up the argument parser with all supported commands."""
-    parser = argparse.ArgumentParser(description="Manage friend gatherings and expense sharing")
-    parser.add_argument("--json", action="store_true", help="Output in JSON format")
-    subparsers = parser.add_subparsers(dest="command", help="Command to run", required=True)
+# Database path, resolved once at import instead of per invocation
+_DB_PATH = os.environ.get("GATHERINGS_DB", "gatherings.db")
+
+@functools.lru_cache(maxsize=None)
+def _get_db_manager(db_path):
+    """Return a cached DatabaseManager for the given path."""
+    return DatabaseManager(db_path)
 
-    # Create command
+def _build_create(subparsers):
+    """Register the create subcommand."""
     create_parser = subparsers.add_parser("create", help="Create a new gathering")
     create_parser.add_argument("gathering_id", help="Unique ID for the gathering (format: yyyy-mm-dd-type)")
     create_parser.add_argument("--members", "-m", type=int, required=True, help="Number of members in the gathering")
 
-    # Add expense command
+def _build_add_expense(subparsers):
+    """Register the add-expense subcommand."""
     expense_parser = subparsers.add_parser("add-expense", help="Add an expense for a member")
     expense_parser.add_argument("gathering_id", help="ID of the gathering")
     expense_parser.add_argument("member_name", help="Name of the member who paid")
     expense_parser.add_argument("amount", type=float, help="Amount paid by the member")
 
-    # Calculate reimbursements command
+def _build_calculate(subparsers):
+    """Register the calculate subcommand."""
     calculate_parser = subparsers.add_parser("calculate", help="Calculate reimbursements for a gathering")
     calculate_parser.add_argument("gathering_id", help="ID of the gathering")
 
-    # Record payment command
+def _build_record_payment(subparsers):
+    """Register the record-payment subcommand."""
     payment_parser = subparsers.add_parser("record-payment", help="Record a payment made by a member")
     payment_parser.add_argument("gathering_id", help="ID of the gathering")
     payment_parser.add_argument("member_name", help="Name of the member making the payment")
     payment_parser.add_argument("amount", type=float, help="Amount paid (negative for reimbursements)")
 
-    # Rename member command
+def _build_rename_member(subparsers):
+    """Register the rename-member subcommand."""
     rename_parser = subparsers.add_parser("rename-member", help="Rename an unnamed member")
     rename_parser.add_argument("gathering_id", help="ID of the gathering")
     rename_parser.add_argument("old_name", help="Current name of the member")
     rename_parser.add_argument("new_name", help="New name for the member")
 
-    # Show gathering command
+def _build_show(subparsers):
+    """Register the show subcommand."""
     show_parser = subparsers.add_parser("show", help="Show details of a gathering")
     show_parser.add_argument("gathering_id", help="ID of the gathering to display")
 
-    # List gatherings command
+def _build_list(subparsers):
+    """Register the list subcommand."""
     subparsers.add_parser("list", help="List all gatherings")
 
-    # Close gathering command
+def _build_close(subparsers):
+    """Register the close subcommand."""
     close_parser = subparsers.add_parser("close", help="Close a gathering")
     close_parser.add_argument("gathering_id", help="ID of the gathering to close")
 
-    # Delete gathering command
+def _build_delete(subparsers):
+    """Register the delete subcommand."""
     delete_parser = subparsers.add_parser("delete", help="Delete a gathering")
     delete_parser.add_argument("gathering_id", help="ID of the gathering to delete")
     delete_parser.add_argument("--force", "-f", action="store_true", help="Force deletion even if gathering is closed")
 
-    # Add member command
+def _build_add_member(subparsers):
+    """Register the add-member subcommand."""
     add_member_parser = subparsers.add_parser("add-member", help="Add a new member to a gathering")
     add_member_parser.add_argument("gathering_id", help="ID of the gathering")
     add_member_parser.add_argument("member_name", help="Name of the member to add")
 
-    # Remove member command
+def _build_remove_member(subparsers):
+    """Register the remove-member subcommand."""
     remove_member_parser = subparsers.add_parser("remove-member", help="Remove a member from a gathering")
     remove_member_parser.add_argument("gathering_id", help="ID of the gathering")
     remove_member_parser.add_argument("member_name", help="Name of the member to remove")
 
+# One builder per subcommand so a one-shot invocation can register only the
+# subparser it is about to use instead of all twelve
+_BUILDERS = {
+    "create": _build_create,
+    "add-expense": _build_add_expense,
+    "calculate": _build_calculate,
+    "record-payment": _build_record_payment,
+    "rename-member": _build_rename_member,
+    "show": _build_show,
+    "list": _build_list,
+    "close": _build_close,
+    "delete": _build_delete,
+    "add-member": _build_add_member,
+    "remove-member": _build_remove_member
+}
+
+def _base_parser():
+    """Create the top-level parser and its subparsers container."""
+    parser = argparse.ArgumentParser(description="Manage friend gatherings and expense sharing")
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run", required=True)
+    return parser, subparsers
+
+def setup_parser():
+    """Set up the argument parser with all supported commands."""
+    parser, subparsers = _base_parser()
+    for build in _BUILDERS.values():
+        build(subparsers)
     return parser
 
-def handle_create(service, args):
-    """Handle the create command."""
-    try:
-        gathering = service.create_gathering(args.gathering_id, args.members)
-        result = {
-            "success": True,
-            "gathering": {
-                "id": gathering.id,
-                "total_members": gathering.total_members,
-                "status": gathering.status.value
+def setup_parser_for(command):
+    """Set up a parser registering only the given command's subparser."""
+    parser, subparsers = _base_parser()
+    _BUILDERS[command](subparsers)
+    return parser
+
+# Parser construction builds 12 subparsers and is not free; memoize it so
+# long-lived callers (tests, the MCP server) pay the cost once.
+_PARSER = None
+
+def _get_parser():
+    """Return the module-level argument parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = setup_parser()
+    return _PARSER
+
+# Result-dict builders shared between the CLI handlers below and the MCP
+# server, which calls the service layer in-process and returns the same
+# JSON-ready payloads.
+
+def build_create_result(gathering):
+    """Build the result dict for a created gathering."""
+    return {
+        "success": True,
+        "gathering": {
+            "id": gathering.id,
+            "total_members": gathering.total_members,
+            "status": gathering.status
+        }
+    }
+
+def build_expense_result(gathering, member, amount):
+    """Build the result dict for an added expense."""
+    return {
+        "success": True,
+        "expense": {
+            "member": member.name,
+            "amount": amount,
+            "total_expenses": gathering.total_expenses
+        }
+    }
+
+def build_calculate_result(gathering, reimbursements):
+    """Build the result dict for a reimbursement calculation."""
+    return {
+        "success": True,
+        "calculation": {
+            "total_expenses": gathering.total_expenses,
+            "expense_per_member": gathering.expense_per_member,
+            "reimbursements": {
+                name: {"amount": amount, "type": "gets_reimbursed" if amount < 0 else "needs_to_pay"}
+                for name, amount in reimbursements.items()
             }
         }
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Created gathering: {gathering.id}")
-            print(f"Total members: {gathering.total_members}")
-            print(f"Status: {gathering.status.value}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    }
 
-def handle_add_expense(service, args):
-    """Handle the add-expense command."""
-    try:
-        gathering, member = service.add_expense(args.gathering_id, args.member_name, args.amount)
-        result = {
-            "success": True,
-            "expense": {
-                "member": member.name,
-                "amount": args.amount,
-                "total_expenses": gathering.total_expenses
+def build_payment_result(member, amount):
+    """Build the result dict for a recorded payment."""
+    return {
+        "success": True,
+        "payment": {
+            "member": member.name,
+            "amount": amount,
+            "type": "reimbursement" if amount < 0 else "payment"
+        }
+    }
+
+def build_rename_result(old_name, member):
+    """Build the result dict for a renamed member."""
+    return {
+        "success": True,
+        "member": {
+            "old_name": old_name,
+            "new_name": member.name
+        }
+    }
+
+def build_show_result(gathering, summary):
+    """Build the result dict for a gathering's details."""
+    return {
+        "success": True,
+        "gathering": {
+            "id": gathering.id,
+            "status": gathering.status,
+            "total_members": gathering.total_members,
+            "total_expenses": summary["total_expenses"],
+            "expense_per_member": summary["expense_per_member"],
+            "members": summary["members"]
+        }
+    }
+
+def build_list_result(gatherings):
+    """Build the result dict for the gathering list."""
+    return {
+        "success": True,
+        "gatherings": [
+            {
+                "id": g.id,
+                "status": g.status
             }
+            for g in gatherings
+        ] if gatherings else []
+    }
+
+def build_close_result(gathering):
+    """Build the result dict for a closed gathering."""
+    return {
+        "success": True,
+        "gathering": {
+            "id": gathering.id,
+            "status": gathering.status
+        }
+    }
+
+def build_delete_result(gathering_id, force):
+    """Build the result dict for a deleted gathering."""
+    return {
+        "success": True,
+        "deleted": {
+            "gathering_id": gathering_id,
+            "forced": force
+        }
+    }
+
+def build_add_member_result(gathering, member):
+    """Build the result dict for an added member."""
+    return {
+        "success": True,
+        "member": {
+            "name": member.name,
+            "gathering_id": gathering.id,
+            "total_members": gathering.total_members
+        }
+    }
+
+def build_remove_member_result(gathering, member_name):
+    """Build the result dict for a removed member."""
+    return {
+        "success": True,
+        "removed": {
+            "member_name": member_name,
+            "gathering_id": gathering.id,
+            "total_members": gathering.total_members
         }
+    }
+
+def cli_handler(fn):
+    """
+    Wrap a command handler with the shared output and error scaffolding.
+
+    The wrapped function does the actual work and returns a pair of zero-arg
+    callables (make_result, make_text). The wrapper invokes only the one the
+    output mode needs, so JSON mode never assembles the human-readable text
+    and text mode never builds the result dict. ValueError is translated
+    into the standard error output, and True/False drives the exit code.
+    """
+    @functools.wraps(fn)
+    def wrapper(service, args):
+        try:
+            make_result, make_text = fn(service, args)
+        except ValueError as e:
+            error = {"success": False, "error": str(e)}
+            if args.json:
+                _emit(error)
+            else:
+                sys.stdout.write(f"Error: {e}\n")
+            return False
         if args.json:
-            print(json.dumps(result))
+            _emit(make_result())
         else:
-            print(f"Added expense of ${args.amount:.2f} for {member.name}")
-            print(f"Total expenses: ${gathering.total_expenses:.2f}")
+            sys.stdout.write(make_text() + "\n")
         return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    return wrapper
+
+@cli_handler
+def handle_create(service, args):
+    """Handle the create command."""
+    gathering = service.create_gathering(args.gathering_id, args.members)
+
+    def make_text():
+        return "\n".join((
+            f"Created gathering: {gathering.id}",
+            f"Total members: {gathering.total_members}",
+            f"Status: {gathering.status}"
+        ))
+    return lambda: build_create_result(gathering), make_text
 
+@cli_handler
+def handle_add_expense(service, args):
+    """Handle the add-expense command."""
+    gathering, member = service.add_expense(args.gathering_id, args.member_name, args.amount)
+
+    def make_text():
+        return "\n".join((
+            f"Added expense of ${args.amount:.2f} for {member.name}",
+            f"Total expenses: ${gathering.total_expenses:.2f}"
+        ))
+    return lambda: build_expense_result(gathering, member, args.amount), make_text
+
+@cli_handler
 def handle_calculate(service, args):
     """Handle the calculate command."""
-    try:
-        reimbursements = service.calculate_reimbursements(args.gathering_id)
-        gathering = service.get_gathering(args.gathering_id)
-        
-        result = {
-            "success": True,
-            "calculation": {
-                "total_expenses": gathering.total_expenses,
-                "expense_per_member": gathering.expense_per_member,
-                "reimbursements": {
-                    name: {"amount": amount, "type": "gets_reimbursed" if amount < 0 else "needs_to_pay"}
-                    for name, amount in reimbursements.items()
-                }
-            }
-        }
-        
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Total expenses: ${gathering.total_expenses:.2f}")
-            print(f"Expense per member: ${gathering.expense_per_member:.2f}")
-            print("Reimbursements:")
-            for name, amount in reimbursements.items():
-                if amount < 0:
-                    print(f"  {name} gets reimbursed ${abs(amount):.2f}")
-                else:
-                    print(f"  {name} needs to pay ${amount:.2f}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    reimbursements = service.calculate_reimbursements(args.gathering_id)
+    gathering = service.get_gathering(args.gathering_id)
 
+    def make_text():
+        lines = [
+            f"Total expenses: ${gathering.total_expenses:.2f}",
+            f"Expense per member: ${gathering.expense_per_member:.2f}",
+            "Reimbursements:"
+        ]
+        for name, amount in reimbursements.items():
+            if amount < 0:
+                lines.append(f"  {name} gets reimbursed ${abs(amount):.2f}")
+            else:
+                lines.append(f"  {name} needs to pay ${amount:.2f}")
+        return "\n".join(lines)
+    return lambda: build_calculate_result(gathering, reimbursements), make_text
+
+@cli_handler
 def handle_record_payment(service, args):
     """Handle the record-payment command."""
-    try:
-        gathering, member = service.record_payment(args.gathering_id, args.member_name, args.amount)
-        result = {
-            "success": True,
-            "payment": {
-                "member": member.name,
-                "amount": args.amount,
-                "type": "reimbursement" if args.amount < 0 else "payment"
-            }
-        }
-        if args.json:
-            print(json.dumps(result))
-        else:
-            if args.amount < 0:
-                print(f"Recorded reimbursement of ${abs(args.amount):.2f} to {member.name}")
-            else:
-                print(f"Recorded payment of ${args.amount:.2f} from {member.name}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    gathering, member = service.record_payment(args.gathering_id, args.member_name, args.amount)
+
+    def make_text():
+        if args.amount < 0:
+            return f"Recorded reimbursement of ${abs(args.amount):.2f} to {member.name}"
+        return f"Recorded payment of ${args.amount:.2f} from {member.name}"
+    return lambda: build_payment_result(member, args.amount), make_text
 
+@cli_handler
 def handle_rename_member(service, args):
     """Handle the rename-member command."""
-    try:
-        member = service.rename_member(args.gathering_id, args.old_name, args.new_name)
-        result = {
-            "success": True,
-            "member": {
-                "old_name": args.old_name,
-                "new_name": member.name
-            }
-        }
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Renamed member from '{args.old_name}' to '{member.name}'")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    member = service.rename_member(args.gathering_id, args.old_name, args.new_name)
 
+    def make_text():
+        return f"Renamed member from '{args.old_name}' to '{member.name}'"
+    return lambda: build_rename_result(args.old_name, member), make_text
+
+@cli_handler
 def handle_show(service, args):
     """Handle the show command."""
-    try:
-        gathering = service.get_gathering(args.gathering_id)
-        if gathering is None:
-            error = {"success": False, "error": f"Gathering '{args.gathering_id}' not found"}
-            if args.json:
-                print(json.dumps(error))
-            else:
-                print(f"Gathering '{args.gathering_id}' not found")
-            return False
-        
-        summary = service.get_payment_summary(args.gathering_id)
-        result = {
-            "success": True,
-            "gathering": {
-                "id": gathering.id,
-                "status": gathering.status.value,
-                "total_members": gathering.total_members,
-                "total_expenses": summary["total_expenses"],
-                "expense_per_member": summary["expense_per_member"],
-                "members": summary["members"]
-            }
-        }
-        
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Gathering: {gathering.id}")
-            print(f"Status: {gathering.status.value}")
-            print(f"Total members: {gathering.total_members}")
-            print(f"Total expenses: ${summary['total_expenses']:.2f}")
-            print(f"Expense per member: ${summary['expense_per_member']:.2f}")
-            
-            print("\nMember details:")
-            for name, data in summary["members"].items():
-                print(f"  {name}:")
-                print(f"    Expenses: ${data['expenses']:.2f}")
-                print(f"    Paid: ${data['paid']:.2f}")
-                print(f"    Balance: ${data['balance']:.2f}")
-                print(f"    Status: {data['status']}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    gathering = service.get_gathering(args.gathering_id)
+    if gathering is None:
+        raise ValueError(f"Gathering '{args.gathering_id}' not found")
+
+    summary = service.get_payment_summary(args.gathering_id)
+
+    def make_text():
+        lines = [
+            f"Gathering: {gathering.id}",
+            f"Status: {gathering.status}",
+            f"Total members: {gathering.total_members}",
+            f"Total expenses: ${summary['total_expenses']:.2f}",
+            f"Expense per member: ${summary['expense_per_member']:.2f}",
+            "",
+            "Member details:"
+        ]
+        # %-formatting dispatches straight to C for floats, unlike f-string
+        # :.2f which goes through __format__; with five floats per member
+        # this is the dominant text-mode cost on large gatherings.
+        lines.extend(
+            "\n".join((
+                "  %s:" % name,
+                "    Expenses: $%.2f" % data["expenses"],
+                "    Paid: $%.2f" % data["paid"],
+                "    Balance: $%.2f" % data["balance"],
+                "    Status: %s" % data["status"]
+            ))
+            for name, data in summary["members"].items()
+        )
+        return "\n".join(lines)
+    return lambda: build_show_result(gathering, summary), make_text
 
 def handle_list(service, args):
-    """Handle the list command."""
+    """
+    Handle the list command.
+
+    Unlike the other handlers this one streams its output row by row rather
+    than going through cli_handler, so a large gathering store never holds
+    both the full list of row dicts and the serialized document in memory.
+    """
     try:
         gatherings = service.list_gatherings()
-        result = {
-            "success": True,
-            "gatherings": [
-                {
-                    "id": g.id,
-                    "status": g.status.value
-                }
-                for g in gatherings
-            ] if gatherings else []
-        }
-        
-        if args.json:
-            print(json.dumps(result))
-        else:
-            if not gatherings:
-                print("No gatherings found")
-            else:
-                print(f"Found {len(gatherings)} gatherings:")
-                for gathering in gatherings:
-                    print(f"  {gathering.id} - Status: {gathering.status.value}")
-        return True
     except ValueError as e:
         error = {"success": False, "error": str(e)}
         if args.json:
-            print(json.dumps(error))
+            _emit(error)
         else:
-            print(f"Error: {e}")
+            sys.stdout.write(f"Error: {e}\n")
         return False
 
+    if args.json:
+        buf = sys.stdout.buffer
+        buf.write(b'{"success":true,"gatherings":[')
+        for i, gathering in enumerate(gatherings):
+            if i:
+                buf.write(b",")
+            buf.write(_dump_bytes({"id": gathering.id, "status": gathering.status}))
+        buf.write(b"]}\n")
+    elif not gatherings:
+        print("No gatherings found")
+    else:
+        print(f"Found {len(gatherings)} gatherings:")
+        for gathering in gatherings:
+            print(f"  {gathering.id} - Status: {gathering.status}")
+    return True
+
+@cli_handler
 def handle_close(service, args):
     """Handle the close command."""
-    try:
-        gathering = service.close_gathering(args.gathering_id)
-        result = {
-            "success": True,
-            "gathering": {
-                "id": gathering.id,
-                "status": gathering.status.value
-            }
-        }
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Closed gathering: {gathering.id}")
-            print(f"Status: {gathering.status.value}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    gathering = service.close_gathering(args.gathering_id)
+
+    def make_text():
+        return "\n".join((
+            f"Closed gathering: {gathering.id}",
+            f"Status: {gathering.status}"
+        ))
+    return lambda: build_close_result(gathering), make_text
 
+@cli_handler
 def handle_delete(service, args):
     """Handle the delete command."""
-    try:
-        service.delete_gathering(args.gathering_id, args.force)
-        result = {
-            "success": True,
-            "deleted": {
-                "gathering_id": args.gathering_id,
-                "forced": args.force
-            }
-        }
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Deleted gathering: {args.gathering_id}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    service.delete_gathering(args.gathering_id, args.force)
 
+    def make_text():
+        return f"Deleted gathering: {args.gathering_id}"
+    return lambda: build_delete_result(args.gathering_id, args.force), make_text
+
+@cli_handler
 def handle_add_member(service, args):
     """Handle the add-member command."""
-    try:
-        gathering, member = service.add_member(args.gathering_id, args.member_name)
-        result = {
-            "success": True,
-            "member": {
-                "name": member.name,
-                "gathering_id": gathering.id,
-                "total_members": gathering.total_members
-            }
-        }
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Added member '{member.name}' to gathering '{gathering.id}'")
-            print(f"Total members: {gathering.total_members}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+    gathering, member = service.add_member(args.gathering_id, args.member_name)
+
+    def make_text():
+        return "\n".join((
+            f"Added member '{member.name}' to gathering '{gathering.id}'",
+            f"Total members: {gathering.total_members}"
+        ))
+    return lambda: build_add_member_result(gathering, member), make_text
 
+@cli_handler
 def handle_remove_member(service, args):
     """Handle the remove-member command."""
+    gathering = service.remove_member(args.gathering_id, args.member_name)
+
+    def make_text():
+        return "\n".join((
+            f"Removed member '{args.member_name}' from gathering '{gathering.id}'",
+            f"Total members: {gathering.total_members}"
+        ))
+    return lambda: build_remove_member_result(gathering, args.member_name), make_text
+
+# Command-to-handler table, built once at import with interned keys so the
+# per-invocation lookup is a pointer-compare hash hit.
+_HANDLERS = {sys.intern(command): handler for command, handler in {
+    "create": handle_create,
+    "add-expense": handle_add_expense,
+    "calculate": handle_calculate,
+    "record-payment": handle_record_payment,
+    "rename-member": handle_rename_member,
+    "show": handle_show,
+    "list": handle_list,
+    "close": handle_close,
+    "delete": handle_delete,
+    "add-member": handle_add_member,
+    "remove-member": handle_remove_member
+}.items()}
+
+# Positional argument specs for the hand-rolled '--json <command> ...' fast
+# path. create and delete take flags and are special-cased in _fast_parse.
+_FAST_POSITIONALS = {
+    "add-expense": (("gathering_id", str), ("member_name", str), ("amount", float)),
+    "calculate": (("gathering_id", str),),
+    "record-payment": (("gathering_id", str), ("member_name", str), ("amount", float)),
+    "rename-member": (("gathering_id", str), ("old_name", str), ("new_name", str)),
+    "show": (("gathering_id", str),),
+    "list": (),
+    "close": (("gathering_id", str),),
+    "add-member": (("gathering_id", str), ("member_name", str)),
+    "remove-member": (("gathering_id", str), ("member_name", str)),
+}
+
+def _fast_parse(argv):
+    """
+    Parse '<command> args...' by hand into an argparse-style namespace.
+
+    The '--json <command> ...' vocabulary is fixed and machine-generated, so
+    positional parsing avoids argparse construction entirely on that hot
+    path. Returns None for anything that does not match exactly, in which
+    case the caller falls back to argparse for proper error reporting.
+    """
+    if not argv:
+        return None
+    command, rest = argv[0], argv[1:]
+    args = argparse.Namespace(json=True, command=command)
+
+    if command == "create":
+        if len(rest) != 3:
+            return None
+        try:
+            if rest[1] in ("--members", "-m"):
+                args.gathering_id = rest[0]
+                args.members = int(rest[2])
+            elif rest[0] in ("--members", "-m"):
+                args.members = int(rest[1])
+                args.gathering_id = rest[2]
+            else:
+                return None
+        except ValueError:
+            return None
+        return args
+
+    if command == "delete":
+        flags = [arg for arg in rest if arg in ("--force", "-f")]
+        positionals = [arg for arg in rest if arg not in ("--force", "-f")]
+        if len(positionals) != 1 or len(flags) > 1:
+            return None
+        args.gathering_id = positionals[0]
+        args.force = bool(flags)
+        return args
+
+    spec = _FAST_POSITIONALS.get(command)
+    if spec is None or len(rest) != len(spec):
+        return None
     try:
-        gathering = service.remove_member(args.gathering_id, args.member_name)
-        result = {
-            "success": True,
-            "removed": {
-                "member_name": args.member_name,
-                "gathering_id": gathering.id,
-                "total_members": gathering.total_members
-            }
-        }
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"Removed member '{args.member_name}' from gathering '{gathering.id}'")
-            print(f"Total members: {gathering.total_members}")
-        return True
-    except ValueError as e:
-        error = {"success": False, "error": str(e)}
-        if args.json:
-            print(json.dumps(error))
-        else:
-            print(f"Error: {e}")
-        return False
+        for (attr, convert), value in zip(spec, rest):
+            setattr(args, attr, convert(value))
+    except ValueError:
+        return None
+    return args
+
+def serve():
+    """
+    Run a long-lived loop reading newline-delimited commands from stdin.
+
+    Each line carries the same arguments a one-shot invocation would pass on
+    the command line (e.g. '--json show 2025-01-01-beer'). Parser setup,
+    module imports, and the database connection are paid once for the whole
+    session instead of once per command, which is the dominant cost when
+    another process drives the CLI.
+    """
+    import shlex
+
+    parser = _get_parser()
+    service = GatheringService(_get_db_manager(_DB_PATH))
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            tokens = shlex.split(line)
+        except ValueError as e:
+            # shlex rejects malformed quoting; a bad line must not take the
+            # whole session down with it
+            print(f"Error: {e}", file=sys.stderr)
+            continue
+        try:
+            args = parser.parse_args(tokens)
+        except SystemExit:
+            # parse_args exits on bad input; report nothing extra and keep
+            # serving (argparse already wrote its message to stderr)
+            continue
+        handler = _HANDLERS.get(sys.intern(args.command))
+        if handler:
+            handler(service, args)
+        sys.stdout.flush()
+        sys.stdout.buffer.flush()
 
 def main():
     """Main entry point for the Gatherings application."""
-    parser = setup_parser()
-    args = parser.parse_args()
-
-    # Initialize the database manager and service
-    db_path = os.environ.get("GATHERINGS_DB", "gatherings.db")
-    db_manager = DatabaseManager(db_path)
-    service = GatheringService(db_manager)
-    
+    # --serve switches to the persistent stdin-driven loop; it is handled
+    # before argparse because the one-shot grammar requires a command
+    if "--serve" in sys.argv[1:]:
+        serve()
+        return
+
+    # Fast path: '--json <command> ...' is a fixed vocabulary, so parse it by
+    # hand and skip argparse construction altogether when it matches
+    args = _fast_parse(sys.argv[2:]) if sys.argv[1:2] == ["--json"] else None
+    if args is None:
+        # Peek at argv for the subcommand so one-shot runs only pay for the
+        # one subparser they use; anything unrecognized (or --help) falls
+        # back to the full parser for proper help and error messages
+        command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+        parser = setup_parser_for(command) if command in _BUILDERS else _get_parser()
+        args = parser.parse_args()
+
     # Route to the appropriate handler based on the command
-    handlers = {
-        "create": handle_create,
-        "add-expense": handle_add_expense,
-        "calculate": handle_calculate,
-        "record-payment": handle_record_payment,
-        "rename-member": handle_rename_member,
-        "show": handle_show,
-        "list": handle_list,
-        "close": handle_close,
-        "delete": handle_delete,
-        "add-member": handle_add_member,
-        "remove-member": handle_remove_member
-    }
-    
-    handler = handlers.get(args.command)
+    handler = _HANDLERS.get(sys.intern(args.command))
     if handler:
+        # Open the database only once we know a real command will run
+        db_manager = _get_db_manager(_DB_PATH)
+        service = GatheringService(db_manager)
         success = handler(service, args)
+        sys.stdout.buffer.flush()
         sys.exit(0 if success else 1)
     else:
         print(f"Unknown command: {args.command}")
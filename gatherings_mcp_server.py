@@ -18,8 +18,6 @@
 """
 import os
 import sys
-import json
-import subprocess
 from typing import Dict, Any, List, Optional, Union, TypedDict
 
 print(f"Python path: {sys.path}")
@@ -27,11 +25,31 @@ print(f"Python executable: {sys.executable}")
 # Import MCP SDK
 from mcp.server.fastmcp import FastMCP
 
+from models import DatabaseManager
+from services import GatheringService
+from gatherings import (
+    build_create_result,
+    build_expense_result,
+    build_calculate_result,
+    build_payment_result,
+    build_rename_result,
+    build_show_result,
+    build_list_result,
+    build_close_result,
+    build_delete_result,
+    build_add_member_result,
+    build_remove_member_result,
+)
+
 # Initialize FastMCP
 mcp = FastMCP("Gatherings")
 
-# Get Python script path from environment or use default
-PYTHON_PATH = os.environ.get("GATHERINGS_SCRIPT", os.path.join(os.getcwd(), "gatherings.py"))
+# Shared database manager and service, created once for the server lifetime.
+# Calling the service in-process avoids paying interpreter startup, argparse,
+# JSON round-trips, and a fresh SQLite open on every tool invocation.
+_DB_PATH = os.environ.get("GATHERINGS_DB_PATH", "gatherings.db")
+_DB = DatabaseManager(_DB_PATH)
+_SVC = GatheringService(_DB)
 
 # Error handling
 def error_handler(error):
@@ -39,36 +57,11 @@ def error_handler(error):
 
 mcp.onerror = error_handler
 
-def run_command(cmd_args):
-    """Execute a command and return the result"""
+def run_action(action):
+    """Invoke a service action and translate errors into result dicts."""
     try:
-        command = ["python", PYTHON_PATH, "--json"] + cmd_args
-        
-        # Execute the command
-        env = os.environ.copy()
-        env["GATHERINGS_DB_PATH"] = os.environ.get("GATHERINGS_DB_PATH", "gatherings.db")
-        
-        process = subprocess.run(
-            command,
-            env=env,
-            capture_output=True,
-            text=True
-        )
-        
-        if process.stderr:
-            print(f"[Command Error] {process.stderr}", file=sys.stderr)
-        
-        try:
-            result = json.loads(process.stdout)
-            return result
-        except json.JSONDecodeError:
-            # If output is not valid JSON, return it as text
-            return {
-                "success": False,
-                "error": "Invalid JSON response",
-                "output": process.stdout
-            }
-    except Exception as e:
+        return action()
+    except ValueError as e:
         return {
             "success": False,
             "error": str(e)
@@ -78,74 +71,96 @@ def run_command(cmd_args):
 @mcp.tool()
 def create_gathering(gathering_id: str, members: int):
     """Create a new gathering"""
-    return run_command(["create", gathering_id, "--members", str(int(members))])
+    return run_action(lambda: build_create_result(_SVC.create_gathering(gathering_id, int(members))))
 
 # Define add_expense handler
 @mcp.tool()
 def add_expense(gathering_id: str, member_name: str, amount: float):
     """Add an expense for a member"""
-    return run_command(["add-expense", gathering_id, member_name, str(amount)])
+    def action():
+        gathering, member = _SVC.add_expense(gathering_id, member_name, amount)
+        return build_expense_result(gathering, member, amount)
+    return run_action(action)
 
 # Define calculate_reimbursements handler
 @mcp.tool()
 def calculate_reimbursements(gathering_id: str):
     """Calculate reimbursements for a gathering"""
-    return run_command(["calculate", gathering_id])
+    def action():
+        reimbursements = _SVC.calculate_reimbursements(gathering_id)
+        gathering = _SVC.get_gathering(gathering_id)
+        return build_calculate_result(gathering, reimbursements)
+    return run_action(action)
 
 # Define record_payment handler
 @mcp.tool()
 def record_payment(gathering_id: str, member_name: str, amount: float):
     """Record a payment made by a member"""
-    return run_command(["record-payment", gathering_id, member_name, str(amount)])
+    def action():
+        gathering, member = _SVC.record_payment(gathering_id, member_name, amount)
+        return build_payment_result(member, amount)
+    return run_action(action)
 
 # Define rename_member handler
 @mcp.tool()
 def rename_member(gathering_id: str, old_name: str, new_name: str):
     """Rename an unnamed member"""
-    return run_command(["rename-member", gathering_id, old_name, new_name])
+    return run_action(lambda: build_rename_result(old_name, _SVC.rename_member(gathering_id, old_name, new_name)))
 
 # Define show_gathering handler
 @mcp.tool()
 def show_gathering(gathering_id: str):
     """Show details of a gathering"""
-    return run_command(["show", gathering_id])
+    def action():
+        gathering = _SVC.get_gathering(gathering_id)
+        if gathering is None:
+            return {"success": False, "error": f"Gathering '{gathering_id}' not found"}
+        summary = _SVC.get_payment_summary(gathering_id)
+        return build_show_result(gathering, summary)
+    return run_action(action)
 
 # Define list_gatherings handler
 @mcp.tool()
 def list_gatherings():
     """List all gatherings"""
-    return run_command(["list"])
+    return run_action(lambda: build_list_result(_SVC.list_gatherings()))
 
 # Define close_gathering handler
 @mcp.tool()
 def close_gathering(gathering_id: str):
     """Close a gathering"""
-    return run_command(["close", gathering_id])
+    return run_action(lambda: build_close_result(_SVC.close_gathering(gathering_id)))
 
 # Define delete_gathering handler
 @mcp.tool()
 def delete_gathering(gathering_id: str, force: bool = False):
     """Delete a gathering"""
-    cmd = ["delete", gathering_id]
-    if force:
-        cmd.append("--force")
-    return run_command(cmd)
+    def action():
+        _SVC.delete_gathering(gathering_id, force)
+        return build_delete_result(gathering_id, force)
+    return run_action(action)
 
 # Define add_member handler
 @mcp.tool()
 def add_member(gathering_id: str, member_name: str):
     """Add a new member to a gathering"""
-    return run_command(["add-member", gathering_id, member_name])
+    def action():
+        gathering, member = _SVC.add_member(gathering_id, member_name)
+        return build_add_member_result(gathering, member)
+    return run_action(action)
 
 # Define remove_member handler
 @mcp.tool()
 def remove_member(gathering_id: str, member_name: str):
     """Remove a member from a gathering"""
-    return run_command(["remove-member", gathering_id, member_name])
+    def action():
+        gathering = _SVC.remove_member(gathering_id, member_name)
+        return build_remove_member_result(gathering, member_name)
+    return run_action(action)
 
 if __name__ == "__main__":
     print("Gatherings MCP server running on stdio", file=sys.stderr)
-    
+
     try:
         mcp.run(transport="stdio")
     except KeyboardInterrupt:
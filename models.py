@@ -22,77 +22,201 @@ Models for the Gatherings application using SQLAlchemy ORM.
 This module defines the data models and database interactions for the Gatherings application.
 """
 
-import enum
+import functools
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 
-from sqlalchemy import create_engine, Column, String, Integer, Float, ForeignKey, Enum, DateTime, func
+from sqlalchemy import create_engine, event, bindparam, Boolean, CheckConstraint, Column, String, Integer, Float, ForeignKey, DateTime, Index, func, insert, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship, Session, scoped_session
+from sqlalchemy.orm import sessionmaker, relationship, Session, scoped_session, object_session, selectinload
+
+from numerics import compute_balances, np
 
 Base = declarative_base()
 
+# Status of a gathering, stored as a plain string. SQLAlchemy's Enum type
+# would round-trip every read through a GatheringStatus(value) call; plain
+# strings are native to SQLite and the CHECK constraint on the column keeps
+# the vocabulary closed at the engine level.
+STATUS_OPEN = "open"
+STATUS_CLOSED = "closed"
+
+
+class GatheringTotals(Base):
+    """
+    SQLAlchemy model for the gathering_totals roll-up table.
+
+    One row per gathering with the running expense and payment sums,
+    maintained by the same triggers that keep member_totals in step
+    (see DatabaseManager.__init__).
+    """
+    __tablename__ = 'gathering_totals'
+
+    gathering_id = Column(String, ForeignKey('gatherings.id'), primary_key=True)
+    total_expenses = Column(Float, nullable=False, default=0.0)
+    total_payments = Column(Float, nullable=False, default=0.0)
 
-class GatheringStatus(enum.Enum):
-    """Status of a gathering."""
-    OPEN = "open"
-    CLOSED = "closed"
+    # Relationships
+    gathering = relationship("Gathering", back_populates="totals")
 
 
 class Gathering(Base):
     """SQLAlchemy model for gatherings table."""
     __tablename__ = 'gatherings'
-    
+    __table_args__ = (CheckConstraint("status IN ('open', 'closed')", name='ck_gathering_status'),)
+
     id = Column(String, primary_key=True)
     total_members = Column(Integer, nullable=False)
-    status = Column(Enum(GatheringStatus), nullable=False, default=GatheringStatus.OPEN)
-    created_at = Column(DateTime, default=datetime.now)
-    
+    status = Column(String(8), nullable=False, default=STATUS_OPEN)
+    # Bumped by every mutation so callers can cheaply detect staleness of
+    # anything they derived from this gathering
+    version = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
     # Relationships
     members = relationship("Member", back_populates="gathering", cascade="all, delete-orphan")
-    
-    @property
+    # The one-row roll-up rides along with the gathering in the same SELECT
+    totals = relationship("GatheringTotals", back_populates="gathering", uselist=False,
+                          lazy='joined', cascade="all, delete-orphan")
+
+    # The three totals are pure functions of the persisted rows, so they are
+    # memoized per instance with cached_property; get_gathering touches
+    # member.balance for every member and each of those calls needs
+    # expense_per_member. _invalidate_totals drops the cache after writes.
+    @functools.cached_property
     def expense_per_member(self) -> float:
         """Calculate the expense per member."""
         if self.total_members == 0:
             return 0.0
-        
-        total_expenses = sum(sum(expense.amount for expense in member.expenses) for member in self.members)
-        return total_expenses / self.total_members
-    
-    @property
+
+        return self.total_expenses / self.total_members
+
+    @functools.cached_property
     def total_expenses(self) -> float:
-        """Calculate total expenses for the gathering."""
-        return sum(sum(expense.amount for expense in member.expenses) for member in self.members)
-    
-    @property
+        """Total expenses for the gathering, read from the roll-up table."""
+        totals = self.totals
+        if totals is not None:
+            return totals.total_expenses
+
+        session = object_session(self)
+        if session is None:
+            # Detached instance: sum the already-loaded collections in Python
+            return sum(sum(expense.amount for expense in member.expenses) for member in self.members)
+
+        # Gatherings with no recorded activity have no roll-up row yet; one
+        # SQL aggregate instead of materializing every expense row as an
+        # ORM object and summing member by member in Python
+        return (
+            session.query(func.coalesce(func.sum(Expense.amount), 0.0))
+            .join(Member, Member.id == Expense.member_id)
+            .filter(Member.gathering_id == self.id)
+            .scalar()
+        )
+
+    @functools.cached_property
     def total_payments(self) -> float:
-        """Calculate total payments for the gathering."""
-        return sum(sum(payment.amount for payment in member.payments) for member in self.members)
+        """Total payments for the gathering, read from the roll-up table."""
+        totals = self.totals
+        if totals is not None:
+            return totals.total_payments
+
+        session = object_session(self)
+        if session is None:
+            # Detached instance: sum the already-loaded collections in Python
+            return sum(sum(payment.amount for payment in member.payments) for member in self.members)
+
+        return (
+            session.query(func.coalesce(func.sum(Payment.amount), 0.0))
+            .join(Member, Member.id == Payment.member_id)
+            .filter(Member.gathering_id == self.id)
+            .scalar()
+        )
+
+    @functools.cached_property
+    def unnamed_members(self) -> List[str]:
+        """Names of members still carrying a placeholder name, in load order."""
+        return [member.name for member in self.members if member.is_unnamed]
+
+    def _invalidate_totals(self) -> None:
+        """Drop the memoized derived attributes after a mutation."""
+        for name in ("expense_per_member", "total_expenses", "total_payments",
+                     "unnamed_members"):
+            self.__dict__.pop(name, None)
+        # Balances stashed on the members by get_gathering go stale with the
+        # totals; only touch the collection if it is already loaded so the
+        # invalidation never triggers a lazy SELECT
+        members = self.__dict__.get('members')
+        if members is not None:
+            for member in members:
+                member.__dict__.pop('_balance', None)
+
+
+class MemberTotals(Base):
+    """
+    SQLAlchemy model for the member_totals roll-up table.
+
+    SQLite has no native materialized views, so this table plays that role:
+    one row per member holding the running expense and payment sums, kept in
+    step by AFTER INSERT/UPDATE/DELETE triggers on the expenses and payments
+    tables (see DatabaseManager.__init__).
+    """
+    __tablename__ = 'member_totals'
+
+    member_id = Column(Integer, ForeignKey('members.id'), primary_key=True)
+    total_expenses = Column(Float, nullable=False, default=0.0)
+    total_payments = Column(Float, nullable=False, default=0.0)
+
+    # Relationships
+    member = relationship("Member", back_populates="totals")
 
 
 class Member(Base):
     """SQLAlchemy model for members table."""
     __tablename__ = 'members'
-    
+    # Nearly every lookup is by (gathering_id, name); the unique index turns
+    # those scans into B-tree probes and enforces name uniqueness per
+    # gathering at the engine level. It is also covering for the common
+    # "find the id for this name" probe: id is the INTEGER PRIMARY KEY and
+    # therefore the rowid, which SQLite stores in every index leaf, so the
+    # lookup never touches the table itself.
+    __table_args__ = (Index('ix_members_gathering_name', 'gathering_id', 'name', unique=True),)
+
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
     gathering_id = Column(String, ForeignKey('gatherings.id'), nullable=False)
-    
+    # True while the member still carries a placeholder name; maintained at
+    # insert and rename so callers never have to prefix-scan names
+    is_unnamed = Column(Boolean, nullable=False, default=False)
+
     # Relationships
     gathering = relationship("Gathering", back_populates="members")
     expenses = relationship("Expense", back_populates="member", cascade="all, delete-orphan")
     payments = relationship("Payment", back_populates="member", cascade="all, delete-orphan")
-    
+    # The roll-up row rides along with the member in the same SELECT; reading
+    # a member's totals is then a joined PK lookup instead of summing every
+    # expense/payment row in Python
+    totals = relationship("MemberTotals", back_populates="member", uselist=False,
+                          lazy='joined', cascade="all, delete-orphan")
+
     @property
     def total_expenses(self) -> float:
-        """Calculate total expenses for this member."""
+        """Total expenses for this member, read from the roll-up table."""
+        totals = self.totals
+        if totals is not None:
+            return totals.total_expenses
+        # Members with no recorded activity have no roll-up row yet
         return sum(expense.amount for expense in self.expenses)
-    
+
     @property
     def total_payments(self) -> float:
-        """Calculate total payments for this member."""
+        """Total payments for this member, read from the roll-up table."""
+        totals = self.totals
+        if totals is not None:
+            return totals.total_payments
         return sum(payment.amount for payment in self.payments)
     
     @property
@@ -102,6 +226,12 @@ class Member(Base):
         Positive balance means they are owed money (they paid more than their share).
         Negative balance means they owe money (they paid less than their share).
         """
+        # get_gathering stashes the set-based result of get_balances here so
+        # the per-member recomputation below only runs for stray instances
+        cached = self.__dict__.get('_balance')
+        if cached is not None:
+            return cached
+
         expense_per_member = self.gathering.expense_per_member
         # Balance = what they paid (expenses + payments) - what they should pay (share)
         # If positive, they paid more than their share and are owed money
@@ -124,9 +254,9 @@ class Expense(Base):
     __tablename__ = 'expenses'
     
     id = Column(Integer, primary_key=True)
-    member_id = Column(Integer, ForeignKey('members.id'), nullable=False)
+    member_id = Column(Integer, ForeignKey('members.id'), nullable=False, index=True)
     amount = Column(Float, nullable=False)
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     member = relationship("Member", back_populates="expenses")
@@ -137,9 +267,9 @@ class Payment(Base):
     __tablename__ = 'payments'
     
     id = Column(Integer, primary_key=True)
-    member_id = Column(Integer, ForeignKey('members.id'), nullable=False)
+    member_id = Column(Integer, ForeignKey('members.id'), nullable=False, index=True)
     amount = Column(Float, nullable=False)
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     member = relationship("Member", back_populates="payments")
@@ -151,15 +281,148 @@ class DatabaseManager:
     def __init__(self, db_path: str = "gatherings.db"):
         """Initialize the DatabaseManager with the specified database path."""
         self.db_path = db_path
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        
+        # SQLAlchemy's default QueuePool is sized for network databases;
+        # StaticPool keeps one SQLite connection alive for the process so
+        # every session reuses the same file handle and page cache
+        # query_cache_size keeps the compiled form of every statement this
+        # module issues resident instead of evicting under the default limit
+        self.engine = create_engine(
+            f'sqlite:///{db_path}',
+            connect_args={'check_same_thread': False},
+            poolclass=StaticPool,
+            query_cache_size=1200
+        )
+
+        # WAL mode lets readers proceed concurrently with the single writer
+        # and synchronous=NORMAL drops one fsync per commit; WAL persists in
+        # the database file once set. temp_store and mmap_size keep sort/temp
+        # structures in memory and read pages via the OS page cache, and the
+        # negative cache_size asks for a 64 MiB page cache. Applying the
+        # pragmas on the connect event covers any connection the pool makes.
+        @event.listens_for(self.engine, 'connect')
+        def _set_pragmas(dbapi_conn, _connection_record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.close()
+
         # Create tables if they don't exist
         Base.metadata.create_all(self.engine)
-        
+
+        # create_all skips tables that already exist, so databases created
+        # before the indexes were declared need them added explicitly
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ix_members_gathering_name "
+                "ON members (gathering_id, name)")
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS ix_expenses_member_id ON expenses (member_id)")
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS ix_payments_member_id ON payments (member_id)")
+
+            # Triggers keep the member_totals and gathering_totals roll-up
+            # tables in step with the raw expense/payment rows, so reads
+            # never re-aggregate. Each write pays a couple of O(1) upserts
+            # instead of every read paying a scan. Dropped and recreated so
+            # databases with an older trigger body pick up the current one.
+            for table, column in (("expense", "total_expenses"), ("payment", "total_payments")):
+                gid = f"(SELECT gathering_id FROM members WHERE id = NEW.member_id)"
+                gid_old = f"(SELECT gathering_id FROM members WHERE id = OLD.member_id)"
+                for suffix in ("ins", "upd", "del"):
+                    conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS tr_{table}_{suffix}")
+                conn.exec_driver_sql(
+                    f"CREATE TRIGGER tr_{table}_ins AFTER INSERT ON {table}s BEGIN "
+                    f"INSERT INTO member_totals (member_id, total_expenses, total_payments) "
+                    f"VALUES (NEW.member_id, 0, 0) ON CONFLICT (member_id) DO NOTHING; "
+                    f"UPDATE member_totals SET {column} = {column} + NEW.amount "
+                    f"WHERE member_id = NEW.member_id; "
+                    f"INSERT INTO gathering_totals (gathering_id, total_expenses, total_payments) "
+                    f"VALUES ({gid}, 0, 0) ON CONFLICT (gathering_id) DO NOTHING; "
+                    f"UPDATE gathering_totals SET {column} = {column} + NEW.amount "
+                    f"WHERE gathering_id = {gid}; END")
+                conn.exec_driver_sql(
+                    f"CREATE TRIGGER tr_{table}_upd AFTER UPDATE ON {table}s BEGIN "
+                    f"UPDATE member_totals SET {column} = {column} + NEW.amount - OLD.amount "
+                    f"WHERE member_id = NEW.member_id; "
+                    f"UPDATE gathering_totals SET {column} = {column} + NEW.amount - OLD.amount "
+                    f"WHERE gathering_id = {gid}; END")
+                conn.exec_driver_sql(
+                    f"CREATE TRIGGER tr_{table}_del AFTER DELETE ON {table}s BEGIN "
+                    f"UPDATE member_totals SET {column} = {column} - OLD.amount "
+                    f"WHERE member_id = OLD.member_id; "
+                    f"UPDATE gathering_totals SET {column} = {column} - OLD.amount "
+                    f"WHERE gathering_id = {gid_old}; END")
+
+            # Databases created before the version column need it added;
+            # create_all does not alter existing tables
+            columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(gatherings)")]
+            if 'version' not in columns:
+                conn.exec_driver_sql(
+                    "ALTER TABLE gatherings ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+            member_columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(members)")]
+            if 'is_unnamed' not in member_columns:
+                conn.exec_driver_sql(
+                    "ALTER TABLE members ADD COLUMN is_unnamed BOOLEAN NOT NULL DEFAULT 0")
+                conn.exec_driver_sql(
+                    "UPDATE members SET is_unnamed = (name LIKE 'member%')")
+
+            # Databases written when status was an Enum column store the
+            # member names 'OPEN'/'CLOSED'; fold them to the string values
+            conn.exec_driver_sql(
+                "UPDATE gatherings SET status = lower(status) "
+                "WHERE status IN ('OPEN', 'CLOSED')")
+
+            # Backfill the roll-up for databases written before the triggers
+            # existed; for new databases this inserts nothing
+            conn.exec_driver_sql(
+                "INSERT INTO member_totals (member_id, total_expenses, total_payments) "
+                "SELECT m.id, "
+                "COALESCE((SELECT SUM(e.amount) FROM expenses e WHERE e.member_id = m.id), 0), "
+                "COALESCE((SELECT SUM(p.amount) FROM payments p WHERE p.member_id = m.id), 0) "
+                "FROM members m WHERE m.id NOT IN (SELECT member_id FROM member_totals) "
+                "AND (EXISTS (SELECT 1 FROM expenses e WHERE e.member_id = m.id) "
+                "OR EXISTS (SELECT 1 FROM payments p WHERE p.member_id = m.id))")
+            conn.exec_driver_sql(
+                "INSERT INTO gathering_totals (gathering_id, total_expenses, total_payments) "
+                "SELECT m.gathering_id, "
+                "COALESCE(SUM(t.total_expenses), 0), COALESCE(SUM(t.total_payments), 0) "
+                "FROM members m JOIN member_totals t ON t.member_id = m.id "
+                "WHERE m.gathering_id NOT IN (SELECT gathering_id FROM gathering_totals) "
+                "GROUP BY m.gathering_id")
+            conn.commit()
+
         # Create a session factory with expire_on_commit=False to avoid detached instance issues
         session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.Session = scoped_session(session_factory)
-    
+
+        # Process-local write counter, bumped by every mutating method; an
+        # equality probe against it is how service-level caches decide
+        # whether any write has happened since they were filled
+        self.version = 0
+
+    @contextmanager
+    def session_scope(self):
+        """
+        Provide the scoped session for one logical unit of work.
+
+        Commits on success and rolls back on error, but never closes the
+        session: the scoped session is meant to live for the thread, and
+        closing it after every method call threw away the identity map and
+        compiled-query caches that make repeated calls cheap.
+        """
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+
     def create_gathering(self, gathering_id: str, total_members: int) -> Gathering:
         """
         Create a new gathering.
@@ -181,136 +444,258 @@ class DatabaseManager:
         except (ValueError, IndexError):
             raise ValueError("Gathering ID must start with a valid date in format yyyy-mm-dd-type")
         
-        session = self.Session()
         try:
-            # Check if gathering already exists
-            existing_gathering = session.query(Gathering).filter_by(id=gathering_id).first()
-            if (existing_gathering):
-                raise ValueError(f"Gathering with ID '{gathering_id}' already exists")
-            
-            # Create the gathering
-            gathering = Gathering(
-                id=gathering_id,
-                total_members=total_members,
-                status=GatheringStatus.OPEN
-            )
-            session.add(gathering)
-            
-            # Create unnamed members
-            for i in range(1, total_members + 1):
-                member_name = f"member{i:04d}"
-                member = Member(name=member_name, gathering_id=gathering_id)
-                session.add(member)
-            
-            session.commit()
-            
-            # Create a new session to fetch the complete gathering with all relationships
-            return self.get_gathering(gathering_id)
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            with self.session_scope() as session:
+                # Create the gathering; the primary key enforces uniqueness,
+                # so there is no need for a SELECT probe before the INSERT
+                gathering = Gathering(
+                    id=gathering_id,
+                    total_members=total_members,
+                    status=STATUS_OPEN
+                )
+                session.add(gathering)
 
-    def add_member(self, gathering_id: str, member_name: str) -> Member:
+                # Seed the unnamed members with a single executemany INSERT
+                # instead of registering total_members ORM instances in the
+                # unit of work one by one
+                if total_members > 0:
+                    session.execute(insert(Member), [
+                        {"name": f"member{i:04d}", "gathering_id": gathering_id,
+                         "is_unnamed": True}
+                        for i in range(1, total_members + 1)
+                    ])
+        except IntegrityError as e:
+            raise ValueError(f"Gathering with ID '{gathering_id}' already exists") from e
+
+        self.version += 1
+        # Fetch the complete gathering with all relationships loaded
+        return self.get_gathering(gathering_id)
+
+    def add_member(self, gathering_id: str, member_name: str) -> Tuple[Gathering, Member]:
         """
         Add a member to a gathering.
-        
+
         Args:
             gathering_id: The ID of the gathering
             member_name: The name of the member
-            
+
         Returns:
-            The created Member object
-            
+            Tuple of (updated Gathering, created Member)
+
         Raises:
             ValueError: If the gathering doesn't exist or is closed, or the member already exists
         """
-        session = self.Session()
         try:
-            # Get the gathering
-            gathering = session.query(Gathering).filter_by(id=gathering_id).first()
-            if not gathering:
-                raise ValueError(f"Gathering '{gathering_id}' not found")
-            
-            # Check if gathering is open
-            if gathering.status == GatheringStatus.CLOSED:
-                raise ValueError(f"Cannot add member to closed gathering '{gathering_id}'")
-            
-            # Check if member already exists
-            existing_member = session.query(Member).filter_by(gathering_id=gathering_id, name=member_name).first()
-            if existing_member:
-                raise ValueError(f"Member '{member_name}' already exists in gathering '{gathering_id}'")
-            
-            # Create the member
-            member = Member(name=member_name, gathering_id=gathering_id)
-            session.add(member)
-            
-            # Update the total members count
-            gathering.total_members += 1
-            
-            session.commit()
-            return member
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
-    
-    def remove_member(self, gathering_id: str, member_name: str) -> None:
+            with self.session_scope() as session:
+                # Get the gathering
+                gathering = session.get(Gathering, gathering_id)
+                if not gathering:
+                    raise ValueError(f"Gathering '{gathering_id}' not found")
+
+                # Check if gathering is open
+                if gathering.status == STATUS_CLOSED:
+                    raise ValueError(f"Cannot add member to closed gathering '{gathering_id}'")
+
+                # Create the member; the unique (gathering_id, name) index does
+                # the duplicate check during the INSERT's own B-tree walk
+                member = Member(name=member_name, gathering_id=gathering_id,
+                                is_unnamed=member_name.startswith("member"))
+                session.add(member)
+
+                # Update the total members count; the per-member share depends
+                # on it, so the memoized totals must be recomputed
+                gathering.total_members += 1
+                gathering.version += 1
+                gathering._invalidate_totals()
+        except IntegrityError as e:
+            raise ValueError(f"Member '{member_name}' already exists in gathering '{gathering_id}'") from e
+
+        self.version += 1
+        return gathering, member
+
+    def remove_member(self, gathering_id: str, member_name: str) -> Gathering:
         """
         Remove a member from a gathering.
-        
+
         Args:
             gathering_id: The ID of the gathering
             member_name: The name of the member
-            
+
+        Returns:
+            The updated Gathering object
+
         Raises:
-            ValueError: If the gathering is closed, the member doesn't exist, 
+            ValueError: If the gathering is closed, the member doesn't exist,
                         or the member has expenses/payments
         """
-        session = self.Session()
-        try:
+        with self.session_scope() as session:
             # Get the gathering
-            gathering = session.query(Gathering).filter_by(id=gathering_id).first()
+            gathering = session.get(Gathering, gathering_id)
             if not gathering:
                 raise ValueError(f"Gathering '{gathering_id}' not found")
-            
+
             # Check if gathering is open
-            if gathering.status == GatheringStatus.CLOSED:
+            if gathering.status == STATUS_CLOSED:
                 raise ValueError(f"Cannot remove member from closed gathering '{gathering_id}'")
-            
+
             # Get the member to remove
             member = session.query(Member).filter_by(gathering_id=gathering_id, name=member_name).first()
             if not member:
                 raise ValueError(f"Member '{member_name}' not found in gathering '{gathering_id}'")
-            
-            # Check if member has expenses
-            expenses_count = session.query(Expense).filter_by(member_id=member.id).count()
-            if expenses_count > 0:
+
+            # We only need to know whether any row exists, not how many;
+            # EXISTS stops at the first index entry where COUNT(*) would
+            # read every matching row
+            if session.query(session.query(Expense).filter_by(member_id=member.id).exists()).scalar():
                 raise ValueError(f"Cannot remove member '{member_name}' who has recorded expenses")
-            
-            # Check if member has payments
-            payments_count = session.query(Payment).filter_by(member_id=member.id).count()
-            if payments_count > 0:
+
+            if session.query(session.query(Payment).filter_by(member_id=member.id).exists()).scalar():
                 raise ValueError(f"Cannot remove member '{member_name}' who has recorded payments")
-            
+
             # Delete the member
             session.delete(member)
-            
-            # Update the total members count
+
+            # Update the total members count; the per-member share depends
+            # on it, so the memoized totals must be recomputed
             gathering.total_members -= 1
-            
-            session.commit()
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
-    
+            gathering.version += 1
+            gathering._invalidate_totals()
+
+        self.version += 1
+        return gathering
+
+    def get_gathering_version(self, gathering_id: str) -> Optional[int]:
+        """
+        Read a gathering's mutation counter without loading the gathering.
+
+        Args:
+            gathering_id: The ID of the gathering
+
+        Returns:
+            The version, or None if the gathering doesn't exist
+        """
+        with self.session_scope() as session:
+            return session.query(Gathering.version).filter_by(id=gathering_id).scalar()
+
+    def data_version(self) -> int:
+        """
+        Read SQLite's data_version counter on the pooled connection.
+
+        The counter moves whenever another connection commits a change to
+        the database file (writes on this connection don't move it), so
+        pairing it with the process-local version counter yields a cache
+        key that notices writes from other processes too.
+
+        Returns:
+            The current PRAGMA data_version value
+        """
+        with self.session_scope() as session:
+            return session.execute(text("PRAGMA data_version")).scalar()
+
+    def get_balances(self, gathering_id: str) -> Dict[int, float]:
+        """
+        Compute the balance of every member of a gathering in one statement.
+
+        Args:
+            gathering_id: The ID of the gathering
+
+        Returns:
+            A dictionary mapping member id to balance; empty if the gathering
+            doesn't exist
+        """
+        with self.session_scope() as session:
+            gathering = session.get(Gathering, gathering_id)
+            if not gathering:
+                return {}
+
+            # One LEFT JOIN against the member_totals roll-up covers every
+            # member, including those with no recorded activity
+            rows = session.execute(
+                text(
+                    "SELECT m.id, "
+                    "COALESCE(t.total_expenses, 0), COALESCE(t.total_payments, 0) "
+                    "FROM members m "
+                    "LEFT JOIN member_totals t ON t.member_id = m.id "
+                    "WHERE m.gathering_id = :gathering_id"
+                ),
+                {"gathering_id": gathering_id}
+            ).fetchall()
+            if not rows:
+                return {}
+
+            per_member = gathering.expense_per_member
+            if np is not None:
+                # Hand the arithmetic to the compiled kernel as two float
+                # arrays; one vectorized pass instead of a Python expression
+                # per member
+                count = len(rows)
+                expenses = np.fromiter((row[1] for row in rows), dtype=np.float64, count=count)
+                payments = np.fromiter((row[2] for row in rows), dtype=np.float64, count=count)
+                balances = compute_balances(expenses, payments, per_member).tolist()
+                return dict(zip((row[0] for row in rows), balances))
+
+            return {row[0]: row[1] + row[2] - per_member for row in rows}
+
+    def fetch_all_member_rows(self, gathering_ids: List[str]) -> List[Tuple]:
+        """
+        Fetch the member rows of many gatherings in one statement.
+
+        Args:
+            gathering_ids: The IDs of the gatherings
+
+        Returns:
+            A list of (gathering_id, member_name, total_expenses,
+            total_payments, total_members, gathering_total_expenses) tuples,
+            ordered by gathering_id; unknown IDs simply yield no rows
+        """
+        with self.session_scope() as session:
+            return session.execute(
+                text(
+                    "SELECT m.gathering_id, m.name, "
+                    "COALESCE(t.total_expenses, 0), COALESCE(t.total_payments, 0), "
+                    "g.total_members, COALESCE(gt.total_expenses, 0) "
+                    "FROM members m "
+                    "JOIN gatherings g ON g.id = m.gathering_id "
+                    "LEFT JOIN member_totals t ON t.member_id = m.id "
+                    "LEFT JOIN gathering_totals gt ON gt.gathering_id = m.gathering_id "
+                    "WHERE m.gathering_id IN :gathering_ids "
+                    "ORDER BY m.gathering_id"
+                ).bindparams(bindparam("gathering_ids", expanding=True)),
+                {"gathering_ids": list(gathering_ids)}
+            ).fetchall()
+
+    def payment_summary_rows(self, gathering_id: str) -> Optional[List[Tuple]]:
+        """
+        Fetch everything a payment summary needs in one statement.
+
+        Args:
+            gathering_id: The ID of the gathering
+
+        Returns:
+            A list of (member_name, total_expenses, total_payments,
+            total_members, gathering_total_expenses) tuples, one per member,
+            or None if the gathering doesn't exist
+        """
+        with self.session_scope() as session:
+            if session.query(Gathering.id).filter_by(id=gathering_id).scalar() is None:
+                return None
+
+            # The roll-up tables already hold every aggregate, so one linear
+            # join replaces the gathering load plus per-member property reads
+            return session.execute(
+                text(
+                    "SELECT m.name, "
+                    "COALESCE(t.total_expenses, 0), COALESCE(t.total_payments, 0), "
+                    "g.total_members, COALESCE(gt.total_expenses, 0) "
+                    "FROM members m "
+                    "JOIN gatherings g ON g.id = m.gathering_id "
+                    "LEFT JOIN member_totals t ON t.member_id = m.id "
+                    "LEFT JOIN gathering_totals gt ON gt.gathering_id = m.gathering_id "
+                    "WHERE m.gathering_id = :gathering_id"
+                ),
+                {"gathering_id": gathering_id}
+            ).fetchall()
+
     def get_gathering(self, gathering_id: str) -> Optional[Gathering]:
         """
         Get a gathering by ID.
@@ -321,20 +706,25 @@ class DatabaseManager:
         Returns:
             The Gathering object, or None if not found
         """
-        session = self.Session()
-        try:
-            # Get gathering with eager loading of all relationships to avoid detached session issues
-            from sqlalchemy.orm import joinedload
-            
+        with self.session_scope() as session:
+            # Get gathering with eager loading of all relationships to avoid
+            # detached session issues. selectinload issues one extra SELECT
+            # per collection; loading two sibling collections with joinedload
+            # would produce a members x expenses x payments cartesian product
+            # that SQLAlchemy then has to de-duplicate in Python.
             gathering = (
                 session.query(Gathering)
                 .options(
-                    joinedload(Gathering.members)
-                    .joinedload(Member.expenses),
-                    joinedload(Gathering.members)
-                    .joinedload(Member.payments)
+                    selectinload(Gathering.members)
+                    .selectinload(Member.expenses),
+                    selectinload(Gathering.members)
+                    .selectinload(Member.payments)
                 )
                 .filter_by(id=gathering_id)
+                # The scoped session lives across calls, so refresh what the
+                # identity map already holds rather than trusting collections
+                # loaded before the latest write
+                .populate_existing()
                 .first()
             )
             
@@ -346,18 +736,18 @@ class DatabaseManager:
                 _ = gathering.total_expenses
                 _ = gathering.total_payments
                 
-                # Load all member attributes
+                # Load all member attributes; balances come from one
+                # set-based query instead of a computation per member
+                balances = self.get_balances(gathering_id)
                 for member in gathering.members:
                     _ = member.id
                     _ = member.name
                     _ = member.total_expenses
                     _ = member.total_payments
-                    _ = member.balance
+                    member._balance = balances[member.id]
                     _ = member.status
-            
+
             return gathering
-        finally:
-            session.close()
     
     def add_expense(self, gathering_id: str, member_name: str, amount: float) -> Tuple[Gathering, Member]:
         """
@@ -377,60 +767,63 @@ class DatabaseManager:
         if amount <= 0:
             raise ValueError("Expense amount must be positive")
         
-        session = self.Session()
-        try:
+        with self.session_scope() as session:
             # Get the gathering
-            gathering = session.query(Gathering).filter_by(id=gathering_id).first()
+            gathering = session.get(Gathering, gathering_id)
             if not gathering:
                 raise ValueError(f"Gathering '{gathering_id}' not found")
-            
+
             # Check if gathering is open
-            if gathering.status == GatheringStatus.CLOSED:
+            if gathering.status == STATUS_CLOSED:
                 raise ValueError(f"Cannot add expense to closed gathering '{gathering_id}'")
-            
+
             # Get the member
             member = session.query(Member).filter_by(gathering_id=gathering_id, name=member_name).first()
             if not member:
-                # If member name doesn't exist, check if we need to rename an existing member
-                # Get available unnamed members
-                unnamed_members = session.query(Member).filter(
-                    Member.gathering_id == gathering_id,
-                    Member.name.like("member%")
-                ).all()
-                
-                if not unnamed_members:
+                # If member name doesn't exist, check if we need to rename an
+                # existing member. startswith compiles to a range condition
+                # the (gathering_id, name) index can drive, and LIMIT 1 stops
+                # at the first unnamed member instead of materializing all of
+                # them the way LIKE + .all() did.
+                member = (
+                    session.query(Member)
+                    .filter(
+                        Member.gathering_id == gathering_id,
+                        Member.name.startswith("member")
+                    )
+                    .order_by(Member.name)
+                    .limit(1)
+                    .first()
+                )
+
+                if not member:
                     raise ValueError(f"Member '{member_name}' not found in gathering '{gathering_id}'")
-                
+
                 # Use the first available unnamed member and rename it
-                member = unnamed_members[0]
                 member.name = member_name
-            
+                member.is_unnamed = member_name.startswith("member")
+
             # Add the expense
             expense = Expense(member_id=member.id, amount=amount)
             session.add(expense)
-            
-            session.commit()
-            
-            # Get fresh copies of the gathering and member
-            updated_gathering = self.get_gathering(gathering_id)
-            
-            # Find the member in the updated gathering
-            updated_member = None
-            for m in updated_gathering.members:
-                if m.name == member_name:
-                    updated_member = m
-                    break
-                    
-            if not updated_member:
-                raise ValueError(f"Cannot find member '{member_name}' after adding expense")
-                
-            return updated_gathering, updated_member
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            session.flush()  # fire the roll-up triggers
+            # The triggers update the roll-up tables behind the ORM's back,
+            # so cached copies of the rows must be dropped before re-reading
+            if member.totals is not None:
+                session.expire(member.totals)
+            else:
+                session.expire(member, ['totals'])
+            if gathering.totals is not None:
+                session.expire(gathering.totals)
+            else:
+                session.expire(gathering, ['totals'])
+            gathering.version += 1
+            gathering._invalidate_totals()
+
+        self.version += 1
+        # The loaded instances stay usable after commit thanks to
+        # expire_on_commit=False; no need to re-read the whole gathering
+        return gathering, member
     
     def record_payment(self, gathering_id: str, member_name: str, amount: float) -> Tuple[Gathering, Member]:
         """
@@ -447,49 +840,146 @@ class DatabaseManager:
         Raises:
             ValueError: If the gathering is closed, the member doesn't exist, or the payment is invalid
         """
-        session = self.Session()
-        try:
+        with self.session_scope() as session:
             # Get the gathering
-            gathering = session.query(Gathering).filter_by(id=gathering_id).first()
+            gathering = session.get(Gathering, gathering_id)
             if not gathering:
                 raise ValueError(f"Gathering '{gathering_id}' not found")
-            
+
             # Check if gathering is open
-            if gathering.status == GatheringStatus.CLOSED:
+            if gathering.status == STATUS_CLOSED:
                 raise ValueError(f"Cannot record payment to closed gathering '{gathering_id}'")
-            
+
             # Get the member
             member = session.query(Member).filter_by(gathering_id=gathering_id, name=member_name).first()
             if not member:
                 raise ValueError(f"Member '{member_name}' not found in gathering '{gathering_id}'")
-            
+
             # Add the payment
             payment = Payment(member_id=member.id, amount=amount)
             session.add(payment)
-            
-            session.commit()
-            
-            # Get fresh copies of the gathering and member
-            updated_gathering = self.get_gathering(gathering_id)
-            
-            # Find the member in the updated gathering
-            updated_member = None
-            for m in updated_gathering.members:
-                if m.name == member_name:
-                    updated_member = m
-                    break
-                    
-            if not updated_member:
-                raise ValueError(f"Cannot find member '{member_name}' after recording payment")
-                
-            return updated_gathering, updated_member
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            session.flush()  # fire the roll-up triggers
+            if member.totals is not None:
+                session.expire(member.totals)
+            else:
+                session.expire(member, ['totals'])
+            if gathering.totals is not None:
+                session.expire(gathering.totals)
+            else:
+                session.expire(gathering, ['totals'])
+            gathering.version += 1
+            gathering._invalidate_totals()
+
+        self.version += 1
+        return gathering, member
     
+    def add_expenses_bulk(self, gathering_id: str, items: List[Tuple[str, float]]) -> Gathering:
+        """
+        Add many expenses in one transaction.
+
+        Args:
+            gathering_id: The ID of the gathering
+            items: A list of (member_name, amount) pairs
+
+        Returns:
+            The updated Gathering object
+
+        Raises:
+            ValueError: If the gathering is closed, a member doesn't exist, or an amount is invalid
+        """
+        for _, amount in items:
+            if amount <= 0:
+                raise ValueError("Expense amount must be positive")
+
+        return self._insert_rows_bulk(gathering_id, items, Expense, "add expense",
+                                      rename_unnamed=True)
+
+    def record_payments_bulk(self, gathering_id: str, items: List[Tuple[str, float]]) -> Gathering:
+        """
+        Record many payments in one transaction.
+
+        Args:
+            gathering_id: The ID of the gathering
+            items: A list of (member_name, amount) pairs; negative amounts are reimbursements
+
+        Returns:
+            The updated Gathering object
+
+        Raises:
+            ValueError: If the gathering is closed or a member doesn't exist
+        """
+        return self._insert_rows_bulk(gathering_id, items, Payment, "record payment")
+
+    def _insert_rows_bulk(self, gathering_id: str, items: List[Tuple[str, float]], model, action: str,
+                          rename_unnamed: bool = False) -> Gathering:
+        """
+        Insert expense or payment rows for many members with one member
+        lookup, one executemany INSERT, and one commit, instead of a full
+        transaction plus gathering reload per row.
+
+        With rename_unnamed, names that don't exist yet claim the next
+        unnamed members in slot order, matching add_expense semantics.
+        """
+        with self.session_scope() as session:
+            # Get the gathering
+            gathering = session.get(Gathering, gathering_id)
+            if not gathering:
+                raise ValueError(f"Gathering '{gathering_id}' not found")
+
+            # Check if gathering is open
+            if gathering.status == STATUS_CLOSED:
+                raise ValueError(f"Cannot {action} to closed gathering '{gathering_id}'")
+
+            # Resolve every referenced member in one query
+            names = {name for name, _ in items}
+            name_to_id = dict(
+                session.query(Member.name, Member.id).filter(
+                    Member.gathering_id == gathering_id,
+                    Member.name.in_(names)
+                )
+            )
+            missing = names.difference(name_to_id)
+            if missing and rename_unnamed:
+                # Unknown names claim unnamed members, first mention first,
+                # exactly as a sequence of add_expense calls would
+                ordered_missing = []
+                for name, _ in items:
+                    if name in missing:
+                        missing.discard(name)
+                        ordered_missing.append(name)
+                pool = (
+                    session.query(Member)
+                    .filter(
+                        Member.gathering_id == gathering_id,
+                        Member.name.startswith("member")
+                    )
+                    .order_by(Member.name)
+                    .limit(len(ordered_missing))
+                    .all()
+                )
+                if len(pool) < len(ordered_missing):
+                    raise ValueError(
+                        f"Member '{ordered_missing[len(pool)]}' not found in gathering '{gathering_id}'")
+                for name, member in zip(ordered_missing, pool):
+                    member.name = name
+                    member.is_unnamed = name.startswith("member")
+                    name_to_id[name] = member.id
+            elif missing:
+                raise ValueError(f"Member '{sorted(missing)[0]}' not found in gathering '{gathering_id}'")
+
+            if items:
+                session.execute(insert(model), [
+                    {"member_id": name_to_id[name], "amount": amount}
+                    for name, amount in items
+                ])
+            gathering.version += 1
+            gathering._invalidate_totals()
+
+        self.version += 1
+        # One reload covers every inserted row; populate_existing refreshes
+        # the roll-up rows the triggers changed
+        return self.get_gathering(gathering_id)
+
     def rename_member(self, gathering_id: str, old_name: str, new_name: str) -> Member:
         """
         Rename a member in a gathering.
@@ -505,47 +995,33 @@ class DatabaseManager:
         Raises:
             ValueError: If the gathering is closed, the member doesn't exist, or the new name is already taken
         """
-        session = self.Session()
         try:
-            # Get the gathering
-            gathering = session.query(Gathering).filter_by(id=gathering_id).first()
-            if not gathering:
-                raise ValueError(f"Gathering '{gathering_id}' not found")
-            
-            # Check if gathering is open
-            if gathering.status == GatheringStatus.CLOSED:
-                raise ValueError(f"Cannot rename member in closed gathering '{gathering_id}'")
-            
-            # Get the member to rename
-            member = session.query(Member).filter_by(gathering_id=gathering_id, name=old_name).first()
-            if not member:
-                raise ValueError(f"Member '{old_name}' not found in gathering '{gathering_id}'")
-            
-            # Check if new name already exists
-            existing_member = session.query(Member).filter_by(gathering_id=gathering_id, name=new_name).first()
-            if existing_member:
-                raise ValueError(f"Member '{new_name}' already exists in gathering '{gathering_id}'")
-            
-            # Update the member name
-            member.name = new_name
-            
-            session.commit()
-            
-            # Get a fresh copy of the gathering
-            updated_gathering = self.get_gathering(gathering_id)
-            
-            # Find the member in the updated gathering
-            for m in updated_gathering.members:
-                if m.name == new_name:
-                    return m
-                    
-            raise ValueError(f"Cannot find member '{new_name}' after renaming")
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            with self.session_scope() as session:
+                # Get the gathering
+                gathering = session.get(Gathering, gathering_id)
+                if not gathering:
+                    raise ValueError(f"Gathering '{gathering_id}' not found")
+
+                # Check if gathering is open
+                if gathering.status == STATUS_CLOSED:
+                    raise ValueError(f"Cannot rename member in closed gathering '{gathering_id}'")
+
+                # Get the member to rename
+                member = session.query(Member).filter_by(gathering_id=gathering_id, name=old_name).first()
+                if not member:
+                    raise ValueError(f"Member '{old_name}' not found in gathering '{gathering_id}'")
+
+                # Update the member name; the unique (gathering_id, name) index
+                # rejects a name that is already taken
+                member.name = new_name
+                member.is_unnamed = new_name.startswith("member")
+                gathering.version += 1
+                gathering._invalidate_totals()
+        except IntegrityError as e:
+            raise ValueError(f"Member '{new_name}' already exists in gathering '{gathering_id}'") from e
+
+        self.version += 1
+        return member
     
     def close_gathering(self, gathering_id: str) -> Gathering:
         """
@@ -560,30 +1036,22 @@ class DatabaseManager:
         Raises:
             ValueError: If the gathering doesn't exist or is already closed
         """
-        session = self.Session()
-        try:
+        with self.session_scope() as session:
             # Get the gathering
-            gathering = session.query(Gathering).filter_by(id=gathering_id).first()
+            gathering = session.get(Gathering, gathering_id)
             if not gathering:
                 raise ValueError(f"Gathering '{gathering_id}' not found")
-            
+
             # Check if already closed
-            if gathering.status == GatheringStatus.CLOSED:
+            if gathering.status == STATUS_CLOSED:
                 raise ValueError(f"Gathering '{gathering_id}' is already closed")
-            
+
             # Close the gathering
-            gathering.status = GatheringStatus.CLOSED
-            
-            session.commit()
-            
-            # Return a fresh copy of the gathering
-            return self.get_gathering(gathering_id)
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            gathering.status = STATUS_CLOSED
+            gathering.version += 1
+
+        self.version += 1
+        return gathering
     
     def delete_gathering(self, gathering_id: str, force: bool = False) -> None:
         """
@@ -596,28 +1064,21 @@ class DatabaseManager:
         Raises:
             ValueError: If the gathering doesn't exist or is closed and force is False
         """
-        session = self.Session()
-        try:
+        with self.session_scope() as session:
             # Get the gathering
-            gathering = session.query(Gathering).filter_by(id=gathering_id).first()
+            gathering = session.get(Gathering, gathering_id)
             if not gathering:
                 raise ValueError(f"Gathering '{gathering_id}' not found")
-            
+
             # Check if closed and not forced
-            if gathering.status == GatheringStatus.CLOSED and not force:
+            if gathering.status == STATUS_CLOSED and not force:
                 raise ValueError(f"Cannot delete closed gathering '{gathering_id}'. Use --force to override.")
-            
+
             # Delete the gathering (cascading delete will handle members, expenses, and payments)
             session.delete(gathering)
-            
-            session.commit()
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
-    
+
+        self.version += 1
+
     def list_gatherings(self) -> List[Gathering]:
         """
         List all gatherings.
@@ -625,10 +1086,6 @@ class DatabaseManager:
         Returns:
             A list of all Gathering objects
         """
-        session = self.Session()
-        try:
+        with self.session_scope() as session:
             # Get all gatherings
-            gatherings = session.query(Gathering).all()
-            return gatherings
-        finally:
-            session.close()
+            return session.query(Gathering).all()
@@ -21,8 +21,15 @@ Services for the Gatherings application.
 This module provides high-level services for managing gatherings and their members.
 """
 
+import itertools
+from operator import attrgetter
 from typing import Dict, List, Tuple, Optional, Any
 from models import DatabaseManager, Gathering, Member
+from numerics import np, settle_amounts
+
+# attrgetter pulls all the fields of a member in one C-level call, so the
+# hot loops below pay one call per member instead of a LOAD_ATTR per field
+_reimb_fields = attrgetter('name', 'total_expenses', 'total_payments')
 
 
 class GatheringService:
@@ -31,6 +38,21 @@ class GatheringService:
     def __init__(self, db_manager: DatabaseManager):
         """Initialize the GatheringService with a DatabaseManager."""
         self.db_manager = db_manager
+        # Reimbursements memoized per gathering as (version, result); entries
+        # are dropped by the mutating methods and ignored once the stored
+        # version falls behind the gathering's mutation counter
+        self._reimb_cache: Dict[str, Tuple[int, Dict[str, float]]] = {}
+        # Recycled per-member summary dicts; callers that poll
+        # get_payment_summary can hand them back via release_summary so
+        # steady-state polling allocates nothing
+        self._summary_dict_pool: List[Dict[str, Any]] = []
+        # Read results memoized against a (local write counter, SQLite
+        # data_version) pair: the first notices writes made through this
+        # DatabaseManager, the second notices commits from any other
+        # connection to the same file. While neither moves, repeated polling
+        # of the summary or the gathering list never re-runs the query
+        self._summary_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._list_cache: Optional[Tuple[Tuple[int, int], List[Gathering]]] = None
     
     def create_gathering(self, gathering_id: str, total_members: int) -> Gathering:
         """Creates a new gathering with the specified number of members."""
@@ -65,8 +87,44 @@ class GatheringService:
         Raises:
             ValueError: If the gathering is closed, the member doesn't exist, or the amount is invalid
         """
+        self._reimb_cache.pop(gathering_id, None)
         return self.db_manager.add_expense(gathering_id, member_name, amount)
     
+    def add_expenses_bulk(self, gathering_id: str, items: List[Tuple[str, float]]) -> Gathering:
+        """
+        Add many expenses in one transaction.
+
+        Args:
+            gathering_id: The ID of the gathering
+            items: A list of (member_name, amount) pairs; unknown names claim
+                   unnamed members just like add_expense
+
+        Returns:
+            The updated Gathering object
+
+        Raises:
+            ValueError: If the gathering is closed, a member doesn't exist, or an amount is invalid
+        """
+        self._reimb_cache.pop(gathering_id, None)
+        return self.db_manager.add_expenses_bulk(gathering_id, items)
+
+    def record_payments_bulk(self, gathering_id: str, items: List[Tuple[str, float]]) -> Gathering:
+        """
+        Record many payments in one transaction.
+
+        Args:
+            gathering_id: The ID of the gathering
+            items: A list of (member_name, amount) pairs; negative amounts are reimbursements
+
+        Returns:
+            The updated Gathering object
+
+        Raises:
+            ValueError: If the gathering is closed or a member doesn't exist
+        """
+        self._reimb_cache.pop(gathering_id, None)
+        return self.db_manager.record_payments_bulk(gathering_id, items)
+
     def calculate_reimbursements(self, gathering_id: str) -> Dict[str, float]:
         """
         Calculate reimbursements for a gathering.
@@ -81,23 +139,116 @@ class GatheringService:
         Raises:
             ValueError: If the gathering doesn't exist
         """
+        # A version probe is one scalar SELECT; on a hit it replaces the
+        # full gathering load and the arithmetic below
+        cached = self._reimb_cache.get(gathering_id)
+        if cached is not None and cached[0] == self.db_manager.get_gathering_version(gathering_id):
+            return cached[1]
+
         gathering = self.get_gathering(gathering_id)
         if not gathering:
             raise ValueError(f"Gathering '{gathering_id}' not found")
-        
-        # Calculate how much each member has paid and should pay
+
+        names, to_pay = self._reimbursement_arrays(gathering)
+        if np is not None:
+            names = names.tolist()
+            to_pay = to_pay.tolist()
+
+        result = dict(zip(names, to_pay))
+        self._reimb_cache[gathering_id] = (gathering.version, result)
+        return result
+
+    def calculate_reimbursements_arrays(self, gathering_id: str) -> Tuple[Any, Any]:
+        """
+        Calculate reimbursements for a gathering in columnar form.
+
+        Counterpart to calculate_reimbursements for consumers that want to
+        sort, sum, or threshold the balances without re-iterating in Python:
+        the columns go straight into np.argsort/np.where style operations.
+
+        Args:
+            gathering_id: The ID of the gathering
+
+        Returns:
+            A (names, amounts) pair of parallel numpy arrays (object and
+            float64), or plain lists when numpy is unavailable; negative
+            amounts mean the member gets reimbursed
+
+        Raises:
+            ValueError: If the gathering doesn't exist
+        """
+        gathering = self.get_gathering(gathering_id)
+        if not gathering:
+            raise ValueError(f"Gathering '{gathering_id}' not found")
+
+        return self._reimbursement_arrays(gathering)
+
+    def _reimbursement_arrays(self, gathering: Gathering) -> Tuple[Any, Any]:
+        """Compute the (names, amounts) columns for a loaded gathering."""
+        # The gathering memoizes expense_per_member, and every db_manager
+        # mutation invalidates the memo, so reading it once here is safe
         expense_per_member = gathering.expense_per_member
-        
-        # Calculate reimbursements
-        reimbursements = {}
-        for member in gathering.members:
-            # Amount to pay = total share - expenses + payments
-            # If negative, member gets reimbursed; if positive, member owes money
-            to_pay = expense_per_member - member.total_expenses + member.total_payments
-            reimbursements[member.name] = to_pay
-        
-        return reimbursements
+
+        # Amount to pay = total share - expenses + payments
+        # If negative, member gets reimbursed; if positive, member owes money
+        members = gathering.members
+        count = len(members)
+        # One attrgetter pass reads every field; everything below only
+        # touches the plain tuples it produced
+        rows = list(map(_reimb_fields, members))
+
+        if np is None:
+            names = [row[0] for row in rows]
+            to_pay = [expense_per_member - expenses + payments
+                      for _, expenses, payments in rows]
+            return names, to_pay
+
+        names = np.array([row[0] for row in rows], dtype=object)
+        expenses = np.fromiter((row[1] for row in rows),
+                               dtype=np.float64, count=count)
+        payments = np.fromiter((row[2] for row in rows),
+                               dtype=np.float64, count=count)
+        out = np.empty(count, dtype=np.float64)
+        settle_amounts(expense_per_member, expenses, payments, out)
+        return names, out
     
+    def calculate_reimbursements_bulk(self, gathering_ids: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Calculate reimbursements for many gatherings with one database query.
+
+        Args:
+            gathering_ids: The IDs of the gatherings
+
+        Returns:
+            A dictionary mapping gathering ID to that gathering's
+            reimbursement dictionary (same shape as calculate_reimbursements);
+            unknown IDs are simply absent from the result
+        """
+        rows = self.db_manager.fetch_all_member_rows(gathering_ids)
+
+        result = {}
+        # Rows arrive ordered by gathering_id, so one groupby pass splits
+        # them without building an intermediate index
+        for gathering_id, group in itertools.groupby(rows, key=lambda row: row[0]):
+            group = list(group)
+            count = len(group)
+            total_members = group[0][4]
+            expense_per_member = group[0][5] / total_members if total_members else 0.0
+            names = [row[1] for row in group]
+
+            if np is None or count < 16:
+                to_pay = [expense_per_member - row[2] + row[3] for row in group]
+            else:
+                expenses = np.fromiter((row[2] for row in group), dtype=np.float64, count=count)
+                payments = np.fromiter((row[3] for row in group), dtype=np.float64, count=count)
+                out = np.empty(count, dtype=np.float64)
+                settle_amounts(expense_per_member, expenses, payments, out)
+                to_pay = out.tolist()
+
+            result[gathering_id] = dict(zip(names, to_pay))
+
+        return result
+
     def record_payment(self, gathering_id: str, member_name: str, amount: float) -> Tuple[Gathering, Member]:
         """
         Record a payment made by a member.
@@ -113,6 +264,7 @@ class GatheringService:
         Raises:
             ValueError: If the gathering is closed, the member doesn't exist, or the payment is invalid
         """
+        self._reimb_cache.pop(gathering_id, None)
         return self.db_manager.record_payment(gathering_id, member_name, amount)
     
     def rename_member(self, gathering_id: str, old_name: str, new_name: str) -> Member:
@@ -130,6 +282,7 @@ class GatheringService:
         Raises:
             ValueError: If the gathering is closed, the member doesn't exist, or the new name is already taken
         """
+        self._reimb_cache.pop(gathering_id, None)
         return self.db_manager.rename_member(gathering_id, old_name, new_name)
     
     def close_gathering(self, gathering_id: str) -> Gathering:
@@ -145,6 +298,7 @@ class GatheringService:
         Raises:
             ValueError: If the gathering doesn't exist or is already closed
         """
+        self._reimb_cache.pop(gathering_id, None)
         return self.db_manager.close_gathering(gathering_id)
     
     def delete_gathering(self, gathering_id: str, force: bool = False) -> None:
@@ -158,6 +312,7 @@ class GatheringService:
         Raises:
             ValueError: If the gathering doesn't exist or is closed and force is False
         """
+        self._reimb_cache.pop(gathering_id, None)
         return self.db_manager.delete_gathering(gathering_id, force)
     
     def list_gatherings(self) -> List[Gathering]:
@@ -167,7 +322,13 @@ class GatheringService:
         Returns:
             A list of all Gathering objects
         """
-        return self.db_manager.list_gatherings()
+        version = (self.db_manager.version, self.db_manager.data_version())
+        if self._list_cache is not None and self._list_cache[0] == version:
+            return self._list_cache[1]
+
+        gatherings = self.db_manager.list_gatherings()
+        self._list_cache = (version, gatherings)
+        return gatherings
     
     def get_payment_summary(self, gathering_id: str) -> Dict[str, Any]:
         """
@@ -192,29 +353,162 @@ class GatheringService:
                 }
             }
             
+        Raises:
+            ValueError: If the gathering doesn't exist
+        """
+        # The cache holds a private master that is never handed out; every
+        # caller gets a pooled copy, so releasing one caller's summary can
+        # never gut another's
+        version = (self.db_manager.version, self.db_manager.data_version())
+        cached = self._summary_cache.get(gathering_id)
+        if cached is not None and cached[0] == version:
+            return self._copy_summary(cached[1])
+
+        # One joined statement against the roll-up tables delivers every
+        # aggregate the summary needs; no ORM load, no per-member property
+        # reads
+        rows = self.db_manager.payment_summary_rows(gathering_id)
+        if rows is None:
+            raise ValueError(f"Gathering '{gathering_id}' not found")
+
+        if rows:
+            total_members = rows[0][3]
+            total_expenses = rows[0][4]
+        else:
+            total_members = 0
+            total_expenses = 0.0
+        expense_per_member = total_expenses / total_members if total_members else 0.0
+
+        # Per-member dicts come from the recycle pool when a caller has
+        # released earlier summaries
+        pool = self._summary_dict_pool
+        members_map = {}
+        for name, expenses, paid, _, _ in rows:
+            balance = expenses + paid - expense_per_member
+            entry = pool.pop() if pool else {}
+            entry['expenses'] = expenses
+            entry['paid'] = paid
+            entry['balance'] = balance
+            # Same epsilon as Member.status to absorb floating-point error
+            if abs(balance) < 0.01:
+                entry['status'] = "settled"
+            elif balance > 0:
+                entry['status'] = "is owed money"
+            else:
+                entry['status'] = "owes money"
+            members_map[name] = entry
+
+        summary = {
+            'total_expenses': total_expenses,
+            'expense_per_member': expense_per_member,
+            'members': members_map
+        }
+        self._summary_cache[gathering_id] = (version, summary)
+        if cached is not None:
+            # The replaced master was never handed out, so its dicts can go
+            # straight back to the pool
+            self.release_summary(cached[1])
+        return self._copy_summary(summary)
+
+    def _copy_summary(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Clone a cached master summary using per-member dicts from the pool."""
+        pool = self._summary_dict_pool
+        members_map = {}
+        for name, data in summary['members'].items():
+            entry = pool.pop() if pool else {}
+            entry.update(data)
+            members_map[name] = entry
+        return {
+            'total_expenses': summary['total_expenses'],
+            'expense_per_member': summary['expense_per_member'],
+            'members': members_map
+        }
+
+    def release_summary(self, summary: Dict[str, Any]) -> None:
+        """
+        Return a payment summary's per-member dicts to the recycle pool.
+
+        Optional counterpart to get_payment_summary for callers that poll it
+        in a loop: recycling the nested dicts keeps steady-state polling
+        allocation-free. Every returned summary is a private copy, so
+        releasing one never affects summaries held elsewhere; the released
+        summary itself must not be used afterwards.
+
+        Args:
+            summary: A dictionary previously returned by get_payment_summary
+        """
+        members = summary.get('members')
+        if not members:
+            return
+        pool = self._summary_dict_pool
+        for entry in members.values():
+            entry.clear()
+            pool.append(entry)
+        members.clear()
+    
+    def get_payment_summary_columnar(self, gathering_id: str) -> Dict[str, Any]:
+        """
+        Get a payment summary for a gathering in columnar (SoA) form.
+
+        A machine-friendly counterpart to get_payment_summary: instead of one
+        nested dict per member, each field is a single column, so large
+        gatherings cost one allocation per column and the float columns can
+        feed NumPy or the numeric kernels directly.
+
+        Args:
+            gathering_id: The ID of the gathering
+
+        Returns:
+            A dictionary with summary information:
+            {
+                'total_expenses': float,
+                'expense_per_member': float,
+                'names': list[str],
+                'expenses': float array,
+                'paid': float array,
+                'balance': float array,
+                'status': list[str]
+            }
+            The three float columns are numpy arrays when numpy is available,
+            plain lists otherwise.
+
         Raises:
             ValueError: If the gathering doesn't exist
         """
         gathering = self.get_gathering(gathering_id)
         if not gathering:
             raise ValueError(f"Gathering '{gathering_id}' not found")
-        
-        summary = {
+
+        members = gathering.members
+        count = len(members)
+        names = []
+        statuses = []
+        if np is not None:
+            expenses = np.empty(count, dtype=np.float64)
+            paid = np.empty(count, dtype=np.float64)
+            balance = np.empty(count, dtype=np.float64)
+        else:
+            expenses = [0.0] * count
+            paid = [0.0] * count
+            balance = [0.0] * count
+
+        for i, member in enumerate(members):
+            names.append(member.name)
+            expenses[i] = member.total_expenses
+            paid[i] = member.total_payments
+            balance[i] = member.balance
+            statuses.append(member.status)
+
+        return {
             'total_expenses': gathering.total_expenses,
             'expense_per_member': gathering.expense_per_member,
-            'members': {}
+            'names': names,
+            'expenses': expenses,
+            'paid': paid,
+            'balance': balance,
+            'status': statuses
         }
-        
-        for member in gathering.members:
-            summary['members'][member.name] = {
-                'expenses': member.total_expenses,
-                'paid': member.total_payments,
-                'balance': member.balance,
-                'status': member.status
-            }
-        
-        return summary
-    
+
     def add_member(self, gathering_id: str, member_name: str) -> Tuple[Gathering, Member]:
         """
         Add a new member to an existing gathering.
@@ -229,9 +523,8 @@ class GatheringService:
         Raises:
             ValueError: If the gathering is closed, doesn't exist, or member already exists
         """
-        member = self.db_manager.add_member(gathering_id, member_name)
-        gathering = self.get_gathering(gathering_id)
-        return gathering, member
+        self._reimb_cache.pop(gathering_id, None)
+        return self.db_manager.add_member(gathering_id, member_name)
     
     def remove_member(self, gathering_id: str, member_name: str) -> Gathering:
         """
@@ -248,5 +541,5 @@ class GatheringService:
             ValueError: If the gathering is closed, doesn't exist, the member doesn't exist,
                        or the member has expenses/payments
         """
-        self.db_manager.remove_member(gathering_id, member_name)
-        return self.get_gathering(gathering_id)
+        self._reimb_cache.pop(gathering_id, None)
+        return self.db_manager.remove_member(gathering_id, member_name)